@@ -4,6 +4,7 @@
 # Standard library imports
 import argparse
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 # Local imports
@@ -47,6 +48,14 @@ def parse_arguments():
         default="timetable.png",
         help="Output PNG file path (default: timetable.png)"
     )
+    parser.add_argument(
+        "--png-compress-level",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="0-9",
+        help="PNG zlib compression level (default: 1, fastest encoding, larger file)"
+    )
     
     args = parser.parse_args()
     
@@ -54,6 +63,9 @@ def parse_arguments():
     if not args.countries.is_file():
         parser.error(f"Countries file not found: {args.countries}")
     
+    # Read the countries file once; it is parsed from memory afterwards
+    args.countries_data = args.countries.read_bytes()
+    
     return args
 
 def main():
@@ -65,7 +77,7 @@ def main():
         tz_manager = TimezoneManager(args.reference)
         
         # Load target timezones
-        timezone_data = tz_manager.load_timezones(args.countries)
+        timezone_data = tz_manager.load_timezones_from_bytes(args.countries_data)
         if not timezone_data:
             raise ValueError("No valid timezones found in the input file")
             
@@ -77,19 +89,24 @@ def main():
         }
         
         # Initialize table generator
-        table_gen = TableGenerator(colors)
+        table_gen = TableGenerator(colors, png_compress_level=args.png_compress_level)
         
         # Prepare data for the table
+        # All rows share one reference time
+        all_periods = tz_manager.get_time_periods_bulk([tz for _, tz in timezone_data])
         table_data = []
-        for country_name, tz in timezone_data:
+        for (country_name, tz), periods in zip(timezone_data, all_periods):
+            first_time = periods[0]['time']
             table_data.append({
                 'country': country_name,
                 'timezone': tz,
-                'periods': tz_manager.get_time_periods(tz)
+                'periods': periods,
+                'period_ids': tz_manager.get_period_ids(periods),
+                'sort_key': first_time.hour * 60 + first_time.minute
             })
         
-        # Sort data by first time period
-        table_data = sorted(table_data, key=lambda x: x['periods'][0]['time'].hour * 60 + x['periods'][0]['time'].minute)
+        # Sort data by first time period (minutes since midnight), in place
+        table_data.sort(key=itemgetter('sort_key'))
         
         # Generate the table
         table_gen.generate_table(
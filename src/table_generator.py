@@ -3,83 +3,153 @@
 
 # Standard library imports
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, Dict, List
+from typing import Union, Dict, List, Optional, Tuple
 
 # Third-party imports
-from PIL import Image, ImageDraw, ImageFont  # Pour la génération d'images
+from PIL import Image, ImageColor, ImageDraw, ImageFont  # Pour la génération d'images
+
+@lru_cache(maxsize=16)
+def _load_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to the default font."""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
 
 class TableGenerator:
-    def __init__(self, colors):
+    def __init__(self, colors, png_compress_level=1):
         """Initialize the table generator."""
         self.colors = colors
+        self.png_compress_level = png_compress_level  # zlib level; 1 trades file size for encoding speed
         self.country_column_width = 200  # Increased width for country names
         self.cell_width = 100
         self.cell_height = 40
         self.font_size = 12
         self.title_font_size = 16
         self.padding = 10
-        self.border_width = 1  # Width of cell borders
+        self.border_width = 1  # Width of grid lines (cells have no separate borders)
         
         # Colors for header and first column
         self.header_bg_color = 'black'
         self.header_text_color = 'white'
         
-        # Try to load a system font
-        try:
-            self.font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", self.font_size)
-            self.title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", self.title_font_size)
-        except OSError:
-            # Fallback to default font
-            self.font = ImageFont.load_default()
-            self.title_font = ImageFont.load_default()
+        # Load system fonts (cached across instances, default font as fallback)
+        self.font = _load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", self.font_size)
+        self.title_font = _load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", self.title_font_size)
+        
+        # Text sizes keyed by (text, font id); time strings repeat across cells
+        self._bbox_cache: Dict[Tuple[str, int], Tuple[int, int]] = {}
+        
+        # Rendered text masks keyed by (text, font id), for strings that repeat
+        self._mask_cache: Dict[Tuple[str, int], Tuple[Image.Image, Tuple[int, int]]] = {}
+        
+        # Last canvas and its (rows, columns, title_height), reused while the shape repeats
+        self._canvas_cache: Optional[Tuple[Tuple[int, int, int], Image.Image]] = None
     
     def _create_base_image(self, rows, columns, title_height):
-        """Create base image with white background."""
-        width = self.country_column_width + columns * self.cell_width
-        height = title_height + (rows + 1) * self.cell_height
+        """Create base image, reusing the last canvas if its shape matches.
+        
+        Only one canvas is kept; a table of another shape replaces it. A new canvas is black (Pillow fills it on allocation) and a reused one
+        still holds the previous table. No background is painted here because
+        generate_table paints every region of the image itself; callers must
+        not rely on the initial contents.
+        """
+        key = (rows, columns, title_height)
+        if self._canvas_cache is not None and self._canvas_cache[0] == key:
+            image = self._canvas_cache[1]
+        else:
+            width = self.country_column_width + columns * self.cell_width
+            height = title_height + (rows + 1) * self.cell_height
+            image = Image.new('RGB', (width, height))
+            self._canvas_cache = (key, image)
         
-        image = Image.new('RGB', (width, height), 'white')
         draw = ImageDraw.Draw(image)
         return image, draw
     
-    def _draw_cell_border(self, draw, x, y, width, height):
-        """Draw border around a cell."""
-        draw.line([(x, y), (x + width, y)], fill='black', width=self.border_width)  # Top
-        draw.line([(x, y + height), (x + width, y + height)], fill='black', width=self.border_width)  # Bottom
-        draw.line([(x, y), (x, y + height)], fill='black', width=self.border_width)  # Left
-        draw.line([(x + width, y), (x + width, y + height)], fill='black', width=self.border_width)  # Right
-    
     def _draw_grid(self, draw, rows, columns, title_height):
-        """Draw grid lines."""
+        """Draw grid lines on top of the filled cells.
+        
+        Each axis is drawn as a single serpentine polyline: consecutive lines
+        are joined along the left/top border (itself a grid line) or along the
+        right/bottom edge (just outside the image), so one draw call per axis
+        covers the whole grid.
+        """
         total_width = self.country_column_width + columns * self.cell_width
         total_height = (rows + 1) * self.cell_height + title_height
         
-        # Draw horizontal lines starting after title
+        # Horizontal lines starting after title
+        points = []
         for row in range(rows + 2):  # +2 for header row and bottom border
             y = title_height + row * self.cell_height
-            draw.line([(0, y), (total_width, y)], fill='black', width=self.border_width)
-        
-        # Draw vertical lines
-        x = 0
-        # First column (country names)
-        draw.line([(x, title_height), (x, total_height)], fill='black', width=self.border_width)
-        x += self.country_column_width
-        draw.line([(x, title_height), (x, total_height)], fill='black', width=self.border_width)
-        
-        # Time columns
-        for col in range(columns + 1):
-            x = self.country_column_width + col * self.cell_width
-            draw.line([(x, title_height), (x, total_height)], fill='black', width=self.border_width)
+            ends = [(0, y), (total_width, y)]
+            points.extend(ends if row % 2 == 0 else reversed(ends))
+        draw.line(points, fill='black', width=self.border_width)
+        
+        # Vertical lines: left border, then country column and time columns
+        xs = [0] + [self.country_column_width + col * self.cell_width for col in range(columns + 1)]
+        points = []
+        for i, x in enumerate(xs):
+            ends = [(x, title_height), (x, total_height)]
+            points.extend(ends if i % 2 == 0 else reversed(ends))
+        draw.line(points, fill='black', width=self.border_width)
+    
+    def _fill_cells(self, image, table_data, rows, columns, title_height, timezone_manager):
+        """Fill all time cells with their period colors in a single paste.
+        
+        Each row's period ids (indices into timezone_manager.PERIOD_TYPES,
+        with unknown types on a trailing white entry) form one line of a columns x rows palette image, which is scaled up
+        to cell size with nearest-neighbour resampling and pasted below the
+        header row.
+        """
+        colors = [self.colors.get(period_type, 'white') for period_type in timezone_manager.PERIOD_TYPES]
+        palette = [
+            channel
+            for color in [*colors, 'white']
+            for channel in ImageColor.getrgb(color)[:3]
+        ]
+        period_ids = b''.join(
+            data.get('period_ids') or timezone_manager.get_period_ids(data['periods'])
+            for data in table_data
+        )
+        cells = Image.frombytes('P', (columns, rows), period_ids)
+        cells.putpalette(palette)
+        block = cells.resize((columns * self.cell_width, rows * self.cell_height), Image.NEAREST)
+        image.paste(block.convert('RGB'), (self.country_column_width, title_height + self.cell_height))
     
-    def _draw_text(self, draw, text, x, y, width, fill='black', font=None, align='center'):
-        """Draw text in cell."""
+    def _text_size(self, draw, text, font):
+        """Return (width, height) of rendered text, memoized per font."""
+        key = (text, id(font))
+        size = self._bbox_cache.get(key)
+        if size is None:
+            text_bbox = draw.textbbox((0, 0), text, font=font)
+            size = (text_bbox[2] - text_bbox[0], text_bbox[3] - text_bbox[1])
+            self._bbox_cache[key] = size
+        return size
+    
+    def _text_mask(self, draw, text, font):
+        """Return the rendered text mask and its offset from the text origin, memoized per font."""
+        key = (text, id(font))
+        cached = self._mask_cache.get(key)
+        if cached is None:
+            left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+            mask = Image.new('L', (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+            cached = (mask, (left, top))
+            self._mask_cache[key] = cached
+        return cached
+    
+    def _draw_text(self, draw, text, x, y, width, fill='black', font=None, align='center', image=None):
+        """Draw text in cell.
+        
+        When image is given, the text is pasted from a cached mask instead of
+        being rendered again; use it for strings that repeat across cells.
+        """
         if font is None:
             font = self.font
             
-        text_bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
+        text_width, text_height = self._text_size(draw, text, font)
         
         if align == 'center':
             text_x = x + (width - text_width) // 2
@@ -88,24 +158,27 @@ class TableGenerator:
             
         text_y = y + (self.cell_height - text_height) // 2
         
-        draw.text((text_x, text_y), text, fill=fill, font=font)
+        if image is None:
+            draw.text((text_x, text_y), text, fill=fill, font=font)
+        else:
+            mask, (left, top) = self._text_mask(draw, text, font)
+            image.paste(fill, (text_x + left, text_y + top), mask)
     
     def _draw_title(self, draw, reference_tz, width, title_height, timezone_manager):
         """Draw title with reference timezone info."""
         # Get reference country name
         country_name = timezone_manager.get_reference_country_name()
-        offset = datetime.now(reference_tz).strftime('%z')
+        now = datetime.now(reference_tz)
+        offset = now.strftime('%z')
         offset_str = f"GMT {offset[:3]}:{offset[3:]}"
         
-        title = f"{'Summer' if datetime.now(reference_tz).dst() else 'Winter'} time in {country_name} ({offset_str})"
+        title = f"{'Summer' if now.dst() else 'Winter'} time in {country_name} ({offset_str})"
         
         # Draw title with yellow background
         draw.rectangle([(0, 0), (width, title_height)], fill='yellow')
         
         # Center title text
-        text_bbox = draw.textbbox((0, 0), title, font=self.title_font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
+        text_width, text_height = self._text_size(draw, title, self.title_font)
         
         x = (width - text_width) // 2
         y = (title_height - text_height) // 2
@@ -146,41 +219,42 @@ class TableGenerator:
         total_width = self.country_column_width + columns * self.cell_width
         self._draw_title(draw, reference_tz, total_width, title_height, timezone_manager)
         
-        # Draw grid
-        self._draw_grid(draw, rows, columns, title_height)
-        
-        # Draw headers (hours in reference timezone)
-        # Fill header background with black
-        draw.rectangle(
-            [(self.country_column_width, title_height), 
-             (total_width, title_height + self.cell_height)],
-            fill=self.header_bg_color
+        # Fill header row and country column backgrounds with black, one block each,
+        # leaving the corner above the country names white
+        total_height = title_height + (rows + 1) * self.cell_height
+        image.paste(
+            'white',
+            (0, title_height, self.country_column_width, title_height + self.cell_height)
+        )
+        image.paste(
+            self.header_bg_color,
+            (self.country_column_width, title_height, total_width, title_height + self.cell_height)
         )
+        image.paste(
+            self.header_bg_color,
+            (0, title_height + self.cell_height, self.country_column_width, total_height)
+        )
+        
+        # Left edge of every time column, shared by the header and all rows
+        column_xs = [self.country_column_width + col * self.cell_width for col in range(columns)]
         
-        # Draw header text in white
-        for col, hour in enumerate(range(8, 20)):  # 8:00 to 19:00
+        # Draw headers (hours in reference timezone) in white
+        for x, hour in zip(column_xs, range(8, 20)):  # 8:00 to 19:00
             time_str = f"{hour:02d}:00"
-            x = self.country_column_width + col * self.cell_width
             self._draw_text(
                 draw, 
                 time_str, 
                 x, 
                 title_height, 
                 self.cell_width,
-                fill=self.header_text_color
+                fill=self.header_text_color,
+                image=image
             )
         
-        # Draw country names and time periods
+        # Draw country names in white, before the cells so that the cell fill
+        # covers any name wider than the country column
         for row, data in enumerate(table_data):
             y = title_height + (row + 1) * self.cell_height
-            
-            # Fill country name background with black
-            draw.rectangle(
-                [(0, y), (self.country_column_width, y + self.cell_height)],
-                fill=self.header_bg_color
-            )
-            
-            # Draw country name in white
             self._draw_text(
                 draw, 
                 data['country'], 
@@ -190,29 +264,30 @@ class TableGenerator:
                 fill=self.header_text_color,
                 align='left'
             )
+        
+        # Fill every time cell with its period color
+        self._fill_cells(image, table_data, rows, columns, title_height, timezone_manager)
+        
+        # Formatted time strings keyed by (hour, minute); few distinct values per table
+        time_cache = {}
+        
+        # Draw time periods
+        for row, data in enumerate(table_data):
+            y = title_height + (row + 1) * self.cell_height
             
-            # Draw time periods
-            for col, period in enumerate(data['periods']):
-                x = self.country_column_width + col * self.cell_width
+            for x, period in zip(column_xs, data['periods']):
+                # Draw time (HH:00, or HH:MM for offsets with minutes)
+                period_time = period['time']
+                key = (period_time.hour, period_time.minute)
+                time_str = time_cache.get(key)
+                if time_str is None:
+                    time_str = timezone_manager.format_time(period_time)
+                    time_cache[key] = time_str
                 
-                # Fill cell with period color
-                color = self.colors.get(period['type'], 'white')
-                draw.rectangle(
-                    [(x, y), (x + self.cell_width, y + self.cell_height)],
-                    fill=color
-                )
-                
-                # Draw cell border
-                self._draw_cell_border(draw, x, y, self.cell_width, self.cell_height)
-                
-                # Draw time
-                # Format time string based on whether it has minutes
-                if period['time'].minute != 0:
-                    time_str = period['time'].strftime("%H:%M")
-                else:
-                    time_str = period['time'].strftime("%H:00")
-                    
-                self._draw_text(draw, time_str, x, y, self.cell_width)
+                self._draw_text(draw, time_str, x, y, self.cell_width, image=image)
+        
+        # Draw grid on top of all fills
+        self._draw_grid(draw, rows, columns, title_height)
         
         # Save image
         # Convert string path to Path object and ensure parent directory exists
@@ -220,6 +295,6 @@ class TableGenerator:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            image.save(output_path, 'PNG')
+            image.save(output_path, 'PNG', optimize=False, compress_level=self.png_compress_level)
         except OSError as e:
             raise OSError(f"Failed to save image to {output_path}: {e}")
\ No newline at end of file
@@ -2,14 +2,278 @@
 # -*- coding: utf-8 -*-
 
 # Standard library imports
-from datetime import datetime
-from typing import Dict, Optional, Tuple
+import sys
+import zoneinfo
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Third-party imports
-import pytz
 import pycountry
 
+# (alpha_3, alpha_2, name) of every ISO country, read from pycountry once per process.
+# Codes are interned so dict lookups can short-circuit on identity.
+_COUNTRY_RECORDS = tuple(
+    (sys.intern(country.alpha_3), sys.intern(country.alpha_2), country.name)
+    for country in pycountry.countries
+)
+
+# Countries split into several timezones: code -> (display name, timezone).
+# Read-only view shared by every TimezoneManager.
+_MULTI_TIMEZONE_COUNTRIES = MappingProxyType({
+    'USA-E': ('United States (Eastern)', 'America/New_York'),
+    'USA-C': ('United States (Central)', 'America/Chicago'),
+    'USA-M': ('United States (Mountain)', 'America/Denver'),
+    'USA-P': ('United States (Pacific)', 'America/Los_Angeles'),
+    'RUS-W': ('Russia (Western)', 'Europe/Moscow'),
+    'RUS-C': ('Russia (Central)', 'Asia/Yekaterinburg'),
+    'RUS-E': ('Russia (Eastern)', 'Asia/Vladivostok'),
+    'CAN-E': ('Canada (Eastern)', 'America/Toronto'),
+    'CAN-C': ('Canada (Central)', 'America/Winnipeg'),
+    'CAN-M': ('Canada (Mountain)', 'America/Edmonton'),
+    'CAN-P': ('Canada (Pacific)', 'America/Vancouver'),
+    'BRA-E': ('Brazil (Eastern)', 'America/Sao_Paulo'),
+    'BRA-C': ('Brazil (Central)', 'America/Manaus'),
+    'CHN-E': ('China (Eastern)', 'Asia/Shanghai'),
+    'CHN-W': ('China (Western)', 'Asia/Urumqi'),
+    'AUS-E': ('Australia (Eastern)', 'Australia/Sydney'),
+    'AUS-C': ('Australia (Central)', 'Australia/Adelaide'),
+    'AUS-W': ('Australia (Western)', 'Australia/Perth'),
+})
+
+@lru_cache(maxsize=None)
+def _country_timezones() -> Dict[str, List[str]]:
+    """Map alpha-2 country codes to their timezones, in zone.tab order.
+    
+    zone.tab is read from the same places zoneinfo looks for timezone data:
+    the system TZPATH first, then the tzdata package.
+    
+    Raises:
+        FileNotFoundError: If no zone.tab can be found
+    """
+    for tz_dir in zoneinfo.TZPATH:
+        zone_tab = Path(tz_dir) / 'zone.tab'
+        if zone_tab.is_file():
+            text = zone_tab.read_text(encoding='utf-8')
+            break
+    else:
+        try:
+            text = resources.files('tzdata').joinpath('zoneinfo', 'zone.tab').read_text(encoding='utf-8')
+        except (ModuleNotFoundError, OSError):
+            raise FileNotFoundError("No zone.tab found in TZPATH or the tzdata package")
+    
+    country_timezones: Dict[str, List[str]] = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        # Fields: country code, coordinates, timezone, optional comment
+        fields = line.split('\t')
+        country_timezones.setdefault(sys.intern(fields[0]), []).append(fields[2])
+    return country_timezones
+
+@lru_cache(maxsize=None)
+def _build_mappings() -> Mapping[str, Mapping]:
+    """Build the mappings between countries and timezones, once per process.
+    
+    The mappings are shared by every TimezoneManager, so they are returned
+    as read-only views.
+    
+    Returns:
+        Mapping: Read-only mappings keyed by the TimezoneManager attribute they back
+    """
+    # Initialize dictionaries
+    country_to_timezone: Dict[str, str] = {}
+    timezone_to_country: Dict[str, str] = {}
+    alpha3_to_name: Dict[str, str] = {}
+    alpha3_to_alpha2: Dict[str, str] = {}
+    alpha3_to_timezone: Dict[str, str] = {}  # First timezone of each country
+    zone_to_country_name: Dict[str, str] = {}  # Any timezone to its country
+
+    # Add multi-timezone countries
+    for code, (name, tz) in _MULTI_TIMEZONE_COUNTRIES.items():
+        country_to_timezone[code] = tz
+        timezone_to_country[tz] = name
+        alpha3_to_name[code] = name
+        zone_to_country_name.setdefault(tz, name)
+
+    # Process all countries (records materialized from pycountry at import)
+    country_timezones = _country_timezones()
+    for alpha_3, alpha_2, name in _COUNTRY_RECORDS:
+        alpha3_to_name[alpha_3] = name
+        alpha3_to_alpha2[alpha_3] = alpha_2
+        
+        # Find matching timezones for this country
+        matching_zones = country_timezones.get(alpha_2, [])
+        if matching_zones:
+            alpha3_to_timezone[alpha_3] = matching_zones[0]
+        for zone in matching_zones:
+            zone_to_country_name.setdefault(zone, name)
+        
+        # Skip multi-timezone countries as they're handled separately
+        if alpha_3 in ['USA', 'RUS', 'CAN', 'BRA', 'CHN', 'AUS']:
+            continue
+        
+        if matching_zones:
+            # Use the first timezone as default for the country
+            country_to_timezone[alpha_3] = matching_zones[0]
+            if matching_zones[0] not in timezone_to_country:
+                timezone_to_country[matching_zones[0]] = name
+
+    return MappingProxyType({
+        'country_to_timezone': MappingProxyType(country_to_timezone),
+        'timezone_to_country': MappingProxyType(timezone_to_country),
+        'alpha3_to_name': MappingProxyType(alpha3_to_name),
+        'alpha3_to_alpha2': MappingProxyType(alpha3_to_alpha2),
+        'alpha3_to_timezone': MappingProxyType(alpha3_to_timezone),
+        'zone_to_country_name': MappingProxyType(zone_to_country_name),
+        # Special handling for multi-timezone countries, one mapping per field
+        'multi_timezone_countries': _MULTI_TIMEZONE_COUNTRIES,
+        'multi_tz_name': MappingProxyType({code: name for code, (name, tz) in _MULTI_TIMEZONE_COUNTRIES.items()}),
+        'multi_tz_zone': MappingProxyType({code: tz for code, (name, tz) in _MULTI_TIMEZONE_COUNTRIES.items()}),
+    })
+
+@lru_cache(maxsize=None)
+def _tz(name):
+    """Return the tzinfo for a timezone identifier, built once per name."""
+    return ZoneInfo(name)
+
+@lru_cache(maxsize=None)
+def _zone_names_by_lower() -> Mapping[str, str]:
+    """Map lower-cased timezone identifiers to their canonical spelling."""
+    return MappingProxyType({name.lower(): name for name in zoneinfo.available_timezones()})
+
+def _is_shared_zone(tzinfo, key):
+    """Tell whether tzinfo is the instance _tz returns for its key."""
+    if not key:
+        return False
+    try:
+        return tzinfo is _tz(key)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+
+def _classify_period(hour, minute):
+    """Classify a time of day as 'early_late', 'noon' or 'normal'."""
+    # Convert hour and minute to a decimal hour for comparison
+    decimal_hour = hour + minute / 60.0
+    
+    if decimal_hour < 9 or decimal_hour >= 18:
+        return 'early_late'
+    elif 12 <= decimal_hour < 13:
+        return 'noon'
+    else:
+        return 'normal'
+
+_ONE_HOUR = timedelta(hours=1)
+
+def _hourly(first, count):
+    """Return count datetimes one hour apart, starting at first."""
+    times = [first]
+    current = first
+    for _ in range(count - 1):
+        current += _ONE_HOUR
+        times.append(current)
+    return tuple(times)
+
+def _reference_hours(reference_time, start, end):
+    """Return each working hour of the reference day as a UTC datetime.
+    
+    Args:
+        reference_time (datetime): Any time on the reference day
+        start (int): First working hour in the reference timezone
+        end (int): Hour at which working hours end (exclusive)
+        
+    Returns:
+        tuple: UTC datetimes, one per working hour
+    """
+    if end <= start:
+        return ()
+    
+    # Get the start of the day in reference timezone
+    ref_start = reference_time.replace(
+        hour=start,
+        minute=0,
+        second=0,
+        microsecond=0
+    )
+    ref_last = ref_start.replace(hour=end - 1)
+    
+    # With a constant reference offset the hours are evenly spaced in UTC
+    if ref_start.utcoffset() == ref_last.utcoffset():
+        utc_start = ref_start.astimezone(timezone.utc)
+        return _hourly(utc_start, end - start)
+    
+    return tuple(ref_start.replace(hour=hour).astimezone(timezone.utc) for hour in range(start, end))
+
+@lru_cache(maxsize=64)
+def _cached_reference_hours(reference_key, reference_date, start, end):
+    """Memoized _reference_hours keyed on the reference zone name and date."""
+    reference_time = datetime.combine(reference_date, time(), tzinfo=_tz(reference_key))
+    return _reference_hours(reference_time, start, end)
+
+def _convert_hours(target_tz, reference_hours):
+    """Convert UTC working hours to the target timezone.
+    
+    Args:
+        target_tz (timezone): Target timezone
+        reference_hours (tuple): UTC datetimes as returned by _reference_hours
+        
+    Returns:
+        tuple: Target timezone datetimes, one per working hour
+    """
+    if not reference_hours:
+        return ()
+    
+    target_start = reference_hours[0].astimezone(target_tz)
+    target_last = reference_hours[-1].astimezone(target_tz)
+    count = len(reference_hours)
+    
+    # Without a UTC offset change in either zone over the working hours, every
+    # conversion is the first one shifted by whole hours
+    if (reference_hours[-1] - reference_hours[0] == timedelta(hours=count - 1)
+            and target_start.utcoffset() == target_last.utcoffset()):
+        return _hourly(target_start, count)
+    
+    # Otherwise convert each hour on its own
+    return tuple(reference_hour.astimezone(target_tz) for reference_hour in reference_hours)
+
+def _target_times(target_tz, reference_time, start, end):
+    """Convert each working hour of the reference day to the target timezone."""
+    return _convert_hours(target_tz, _reference_hours(reference_time, start, end))
+
+@lru_cache(maxsize=512)
+def _cached_target_times(target_key, reference_key, reference_date, start, end):
+    """Memoized _target_times keyed on zone names and the reference date."""
+    reference_hours = _cached_reference_hours(reference_key, reference_date, start, end)
+    return _convert_hours(_tz(target_key), reference_hours)
+
 class TimezoneManager:
+    __slots__ = (
+        'reference_tz',
+        'working_hours',
+        'country_to_timezone',
+        'timezone_to_country',
+        'alpha3_to_name',
+        'alpha3_to_alpha2',
+        'alpha3_to_timezone',
+        'zone_to_country_name',
+        'multi_timezone_countries',
+        '_multi_tz_name',
+        '_multi_tz_zone',
+    )
+    
+    # Period types in id order, as encoded by get_period_ids;
+    # any other type gets the id just past them
+    PERIOD_TYPES = ('normal', 'noon', 'early_late')
+    _PERIOD_TYPE_IDS = {period_type: i for i, period_type in enumerate(PERIOD_TYPES)}
+    _UNKNOWN_PERIOD_ID = len(PERIOD_TYPES)
+    
+    # Period type for every minute of the day, indexed by hour * 60 + minute
+    _PERIOD_TABLE = tuple(_classify_period(hour, minute) for hour in range(24) for minute in range(60))
+    
     def __init__(self, reference_timezone):
         """Initialize the timezone manager.
         
@@ -18,24 +282,23 @@ class TimezoneManager:
         """
         self._initialize_country_mappings()
         
+        # Handle both timezone and country code input for reference
+        code = reference_timezone.upper()
+        if code in self._multi_tz_zone:  # Multi-timezone country code
+            zone_name = self._multi_tz_zone[code]
+        elif code in self.alpha3_to_alpha2:  # Standard country code
+            # Use the country's first timezone
+            zone_name = self.alpha3_to_timezone.get(code)
+            if not zone_name:
+                raise ValueError(f"No timezone found for country: {reference_timezone}")
+        else:  # Timezone identifier, matched case-insensitively as pytz did
+            zone_name = _zone_names_by_lower().get(reference_timezone.lower(), reference_timezone)
+        
         try:
-            # Handle both timezone and country code input for reference
-            if '-' in reference_timezone:  # Multi-timezone country code
-                if reference_timezone not in self.multi_timezone_countries:
-                    raise ValueError(f"Invalid multi-timezone country code: {reference_timezone}")
-                reference_timezone = self.multi_timezone_countries[reference_timezone][1]
-            else:  # Standard country code or timezone
-                country = pycountry.countries.get(alpha_3=reference_timezone)
-                if country:
-                    # Get timezones for this country's alpha-2 code
-                    matching_zones = pytz.country_timezones.get(country.alpha_2, [])
-                    if matching_zones:
-                        reference_timezone = matching_zones[0]
-                    else:
-                        raise ValueError(f"No timezone found for country: {reference_timezone}")
-            
-            self.reference_tz = pytz.timezone(reference_timezone)
-        except pytz.exceptions.UnknownTimeZoneError:
+            self.reference_tz = _tz(zone_name)
+        except (ZoneInfoNotFoundError, ValueError, OSError):
+            # zoneinfo rejects malformed keys with ValueError and
+            # non-TZif paths (directories, data files) with OSError
             raise ValueError(f"Invalid timezone or country code: {reference_timezone}")
         
         # Working hours in reference timezone
@@ -45,56 +308,21 @@ class TimezoneManager:
         }
 
     def _initialize_country_mappings(self):
-        """Initialize mappings between countries and timezones."""
-        # Initialize dictionaries
-        self.country_to_timezone: Dict[str, str] = {}
-        self.timezone_to_country: Dict[str, str] = {}
-        self.alpha3_to_name: Dict[str, str] = {}
-
-        # Special handling for multi-timezone countries
-        self.multi_timezone_countries = {
-            'USA-E': ('United States (Eastern)', 'America/New_York'),
-            'USA-C': ('United States (Central)', 'America/Chicago'),
-            'USA-M': ('United States (Mountain)', 'America/Denver'),
-            'USA-P': ('United States (Pacific)', 'America/Los_Angeles'),
-            'RUS-W': ('Russia (Western)', 'Europe/Moscow'),
-            'RUS-C': ('Russia (Central)', 'Asia/Yekaterinburg'),
-            'RUS-E': ('Russia (Eastern)', 'Asia/Vladivostok'),
-            'CAN-E': ('Canada (Eastern)', 'America/Toronto'),
-            'CAN-C': ('Canada (Central)', 'America/Winnipeg'),
-            'CAN-M': ('Canada (Mountain)', 'America/Edmonton'),
-            'CAN-P': ('Canada (Pacific)', 'America/Vancouver'),
-            'BRA-E': ('Brazil (Eastern)', 'America/Sao_Paulo'),
-            'BRA-C': ('Brazil (Central)', 'America/Manaus'),
-            'CHN-E': ('China (Eastern)', 'Asia/Shanghai'),
-            'CHN-W': ('China (Western)', 'Asia/Urumqi'),
-            'AUS-E': ('Australia (Eastern)', 'Australia/Sydney'),
-            'AUS-C': ('Australia (Central)', 'Australia/Adelaide'),
-            'AUS-W': ('Australia (Western)', 'Australia/Perth'),
-        }
-
-        # Add multi-timezone countries
-        for code, (name, tz) in self.multi_timezone_countries.items():
-            self.country_to_timezone[code] = tz
-            self.timezone_to_country[tz] = name
-            self.alpha3_to_name[code] = name
-
-        # Process all countries from pycountry
-        for country in pycountry.countries:
-            self.alpha3_to_name[country.alpha_3] = country.name
-            
-            # Skip multi-timezone countries as they're handled separately
-            if country.alpha_3 in ['USA', 'RUS', 'CAN', 'BRA', 'CHN', 'AUS']:
-                continue
-            
-            # Find matching timezones for this country
-            matching_zones = [tz for tz in pytz.all_timezones if country.alpha_2 in pytz.country_timezones.get(country.alpha_2, [])]
-            
-            if matching_zones:
-                # Use the first timezone as default for the country
-                self.country_to_timezone[country.alpha_3] = matching_zones[0]
-                if matching_zones[0] not in self.timezone_to_country:
-                    self.timezone_to_country[matching_zones[0]] = country.name
+        """Bind the process-wide mappings between countries and timezones.
+        
+        The mappings are built on first use and shared by every instance as
+        read-only MappingProxyType views.
+        """
+        mappings = _build_mappings()
+        self.country_to_timezone = mappings['country_to_timezone']
+        self.timezone_to_country = mappings['timezone_to_country']
+        self.alpha3_to_name = mappings['alpha3_to_name']
+        self.alpha3_to_alpha2 = mappings['alpha3_to_alpha2']
+        self.alpha3_to_timezone = mappings['alpha3_to_timezone']
+        self.zone_to_country_name = mappings['zone_to_country_name']
+        self.multi_timezone_countries = mappings['multi_timezone_countries']
+        self._multi_tz_name = mappings['multi_tz_name']
+        self._multi_tz_zone = mappings['multi_tz_zone']
 
     def get_timezone_for_country(self, country_code: str) -> Optional[str]:
         """Get timezone identifier for a country code.
@@ -105,60 +333,84 @@ class TimezoneManager:
         Returns:
             Optional[str]: Timezone identifier or None if not found
         """
+        # Codes are matched case-insensitively, as pycountry does for alpha-3
+        code = country_code.upper()
+        
         # Check multi-timezone countries first
-        if country_code in self.multi_timezone_countries:
-            return self.multi_timezone_countries[country_code][1]
+        zone = self._multi_tz_zone.get(code)
+        if zone:
+            return zone
 
-        try:
-            # Try to get the country from the alpha-3 code
-            country = pycountry.countries.get(alpha_3=country_code)
-            if country:
-                # Get timezones for this country's alpha-2 code
-                matching_zones = pytz.country_timezones.get(country.alpha_2, [])
-                if matching_zones:
-                    return matching_zones[0]  # Return first timezone
-        except (KeyError, AttributeError):
-            pass
-        return None
+        return self.alpha3_to_timezone.get(code)
     
-    def load_timezones(self, timezone_file) -> list[Tuple[str, pytz.timezone]]:
+    def load_timezones(self, timezone_file) -> list[Tuple[str, ZoneInfo]]:
         """Load timezones from a file.
         
         Args:
             timezone_file (Path): Path to file containing country codes
             
+        Returns:
+            list: List of tuples (country_name, timezone_object)
+        """
+        return self.load_timezones_from_bytes(Path(timezone_file).read_bytes())
+    
+    def load_timezones_from_bytes(self, data: bytes) -> list[Tuple[str, ZoneInfo]]:
+        """Load timezones from the raw content of a countries file.
+        
+        Lines are split and stripped of comments as bytes; only the country
+        codes themselves are decoded.
+        
+        Args:
+            data (bytes): UTF-8 content of a file containing country codes
+            
+        Returns:
+            list: List of tuples (country_name, timezone_object)
+        """
+        country_codes = []
+        for line in data.splitlines():
+            # Extract country code (first word before any comment),
+            # skipping empty lines and comment-only lines
+            words = line.partition(b'#')[0].split(None, 1)
+            if words:
+                country_codes.append(words[0].decode('utf-8'))
+        return self._resolve_country_codes(country_codes)
+    
+    def _resolve_country_codes(self, country_codes) -> list[Tuple[str, ZoneInfo]]:
+        """Resolve country codes to (country_name, timezone_object) tuples.
+        
+        Unknown codes and codes whose timezone cannot be loaded are reported
+        and skipped.
+        
+        Args:
+            country_codes (Iterable[str]): Country codes, in file order
+            
         Returns:
             list: List of tuples (country_name, timezone_object)
         """
         timezone_data = []
-        with open(timezone_file, 'r') as f:
-            for line in f:
-                # Skip empty lines and comments
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Extract country code (first word before any comment or whitespace)
-                country_code = line.split('#')[0].strip()
-                country_code = country_code.split()[0] if country_code else ''
-                
-                if not country_code:
-                    continue
-                
-                # Get timezone identifier from country code
-                tz_name = self.get_timezone_for_country(country_code)
-                if not tz_name:
-                    country_name = self.alpha3_to_name.get(country_code, country_code)
-                    print(f"Warning: Unknown country code ignored: {country_code} ({country_name})")
-                    continue
-                
-                try:
-                    tz = pytz.timezone(tz_name)
-                    country_name = self.get_country_name(country_code)
-                    timezone_data.append((country_name, tz))
-                except pytz.exceptions.UnknownTimeZoneError:
-                    country_name = self.alpha3_to_name.get(country_code, country_code)
-                    print(f"Warning: Invalid timezone ignored for country {country_name}: {tz_name}")
+        resolved: Dict[str, Tuple[str, ZoneInfo]] = {}  # Codes already looked up in this file
+        for country_code in country_codes:
+            country_code = sys.intern(country_code)
+            
+            if country_code in resolved:
+                timezone_data.append(resolved[country_code])
+                continue
+            
+            # Get timezone identifier from country code
+            tz_name = self.get_timezone_for_country(country_code)
+            if not tz_name:
+                country_name = self.alpha3_to_name.get(country_code, country_code)
+                print(f"Warning: Unknown country code ignored: {country_code} ({country_name})")
+                continue
+            
+            try:
+                tz = _tz(tz_name)
+                country_name = self.get_country_name(country_code)
+                resolved[country_code] = (country_name, tz)
+                timezone_data.append(resolved[country_code])
+            except ZoneInfoNotFoundError:
+                country_name = self.alpha3_to_name.get(country_code, country_code)
+                print(f"Warning: Invalid timezone ignored for country {country_name}: {tz_name}")
         return timezone_data
     
     def get_period_type(self, hour, minute=0):
@@ -171,15 +423,21 @@ class TimezoneManager:
         Returns:
             str: Period type ('early_late', 'noon', or 'normal')
         """
-        # Convert hour and minute to a decimal hour for comparison
-        decimal_hour = hour + minute / 60.0
+        return self._PERIOD_TABLE[hour * 60 + minute]
+    
+    def get_period_ids(self, periods) -> bytes:
+        """Encode the types of a row of periods as ids.
         
-        if decimal_hour < 9 or decimal_hour >= 18:
-            return 'early_late'
-        elif 12 <= decimal_hour < 13:
-            return 'noon'
-        else:
-            return 'normal'
+        Args:
+            periods (list): Periods as returned by get_time_periods
+            
+        Returns:
+            bytes: One index into PERIOD_TYPES per period, or len(PERIOD_TYPES)
+                for a type outside it
+        """
+        type_ids = self._PERIOD_TYPE_IDS
+        unknown = self._UNKNOWN_PERIOD_ID
+        return bytes(type_ids.get(period['type'], unknown) for period in periods)
     
     def get_time_periods(self, target_tz, reference_time=None):
         """Get time periods for the target timezone.
@@ -193,37 +451,44 @@ class TimezoneManager:
         """
         if reference_time is None:
             reference_time = datetime.now(self.reference_tz)
-            
-        # Get the start of the day in reference timezone
-        ref_start = reference_time.replace(
-            hour=self.working_hours['start'],
-            minute=0,
-            second=0,
-            microsecond=0
-        )
         
-        periods = []
-        current_hour = self.working_hours['start']
+        start = self.working_hours['start']
+        end = self.working_hours['end']
+        target_key = getattr(target_tz, 'key', None)
+        reference_tzinfo = reference_time.tzinfo
+        reference_key = getattr(reference_tzinfo, 'key', None)
         
-        while current_hour < self.working_hours['end']:
-            # Get time in reference timezone
-            ref_time = ref_start.replace(hour=current_hour)
-            # Convert to target timezone
-            target_time = ref_time.astimezone(target_tz)
-            
-            # Determine period type based on target timezone hour and minute
-            target_hour = target_time.hour
-            target_minute = target_time.minute
-            period_type = self.get_period_type(target_hour, target_minute)
-            
-            periods.append({
-                'time': target_time,
-                'type': period_type
-            })
-            
-            current_hour += 1
+        # The cache rebuilds zones from their keys, so it only applies to the
+        # shared instances _tz returns (not ZoneInfo.no_cache/from_file ones)
+        if _is_shared_zone(target_tz, target_key) and _is_shared_zone(reference_tzinfo, reference_key):
+            # Conversions only depend on the zones and the reference date
+            target_times = _cached_target_times(target_key, reference_key, reference_time.date(), start, end)
+        else:
+            target_times = _target_times(target_tz, reference_time, start, end)
+        
+        # Determine period type based on target timezone hour and minute
+        return [
+            {'time': target_time, 'type': self.get_period_type(target_time.hour, target_time.minute)}
+            for target_time in target_times
+        ]
+
+    def get_time_periods_bulk(self, target_tzs, reference_time=None):
+        """Get time periods for several target timezones at once.
+        
+        The reference time is resolved once and shared by every target, so
+        all rows describe the same reference day.
+        
+        Args:
+            target_tzs (Iterable[timezone]): Target timezones
+            reference_time (datetime, optional): Reference time. Defaults to current time.
             
-        return periods
+        Returns:
+            list: One list of time periods per target timezone, as returned by get_time_periods
+        """
+        if reference_time is None:
+            reference_time = datetime.now(self.reference_tz)
+        
+        return [self.get_time_periods(target_tz, reference_time) for target_tz in target_tzs]
 
     def format_time(self, dt):
         """Format datetime object to hour string.
@@ -236,8 +501,8 @@ class TimezoneManager:
         """
         # For timezones with 30-minute offsets, show the actual minutes
         if dt.minute != 0:
-            return dt.strftime("%H:%M")
-        return dt.strftime("%H:00")
+            return f"{dt.hour:02d}:{dt.minute:02d}"
+        return f"{dt.hour:02d}:00"
 
     def get_country_name(self, country_code: str) -> str:
         """Get country name from country code.
@@ -248,15 +513,15 @@ class TimezoneManager:
         Returns:
             str: Country name or code if not found
         """
+        # Codes are matched case-insensitively, as in get_timezone_for_country
+        code = country_code.upper()
+        
         # Check multi-timezone countries first
-        if country_code in self.multi_timezone_countries:
-            return self.multi_timezone_countries[country_code][0]
+        name = self._multi_tz_name.get(code)
+        if name:
+            return name
 
-        try:
-            country = pycountry.countries.get(alpha_3=country_code)
-            return country.name if country else country_code
-        except (KeyError, AttributeError):
-            return country_code
+        return self.alpha3_to_name.get(code, country_code)
 
     def get_reference_country_name(self) -> str:
         """Get the name of the reference country.
@@ -264,14 +529,6 @@ class TimezoneManager:
         Returns:
             str: Country name
         """
-        # Check if it's a multi-timezone country
-        for code, (name, tz) in self.multi_timezone_countries.items():
-            if tz == self.reference_tz.zone:
-                return name
-
-        # Otherwise, try to find the country by timezone
-        for country in pycountry.countries:
-            matching_zones = pytz.country_timezones.get(country.alpha_2, [])
-            if self.reference_tz.zone in matching_zones:
-                return country.name
-        return self.reference_tz.zone.split('/')[-1]
\ No newline at end of file
+        # Multi-timezone names take precedence over country names in the index
+        zone = self.reference_tz.key
+        return self.zone_to_country_name.get(zone, zone.split('/')[-1])
\ No newline at end of file